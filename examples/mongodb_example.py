@@ -8,11 +8,12 @@ Shows document operations and NoSQL patterns.
 import sys
 import os
 
-# Add parent directory to path to import modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Add parent directory to path to import modules (once)
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from generic_database_connector import GenericDatabaseConnector
-from generic_database_manager import GenericDatabaseManager
 import logging
 
 # Configure logging
@@ -31,8 +32,8 @@ def main():
         
         logger.info("✅ Connected to MongoDB successfully!")
         
-        # Create manager
-        manager = GenericDatabaseManager(db)
+        # Reuse the manager cached on the connector
+        manager = db.manager
         
         # 1. INSERT - Add documents
         logger.info("\n=== INSERT Operations ===")
@@ -73,17 +74,17 @@ def main():
             }
         ]
         
-        for product in products:
-            manager.insert_one("products", product)
-        logger.info(f"Inserted {len(products)} more products")
+        product_ids = manager.insert_many("products", products)
+        logger.info(f"Inserted {len(product_ids) if product_ids else 0} more products")
         
         # 2. FIND - Query documents
         logger.info("\n=== FIND Operations ===")
-        all_products = manager.find_all("products", limit=10)
-        if all_products:
-            logger.info(f"Found {len(all_products)} products:")
-            for product in all_products:
-                logger.info(f"  - {product.get('name')}: ${product.get('price')}")
+        all_products = manager.find_all("products", limit=10, fields=["name", "price"])
+        if all_products and logger.isEnabledFor(logging.INFO):
+            # One log record for the whole listing instead of one per document
+            lines = "\n".join(f"  - {product.get('name')}: ${product.get('price')}"
+                              for product in all_products)
+            logger.info(f"Found {len(all_products)} products:\n{lines}")
         
         # 3. UPDATE - Modify documents
         logger.info("\n=== UPDATE Operations ===")
@@ -99,10 +100,9 @@ def main():
         deleted = manager.delete_one("products", {"name": "Mouse"})
         logger.info(f"Deleted {deleted} product(s)")
         
-        # Final count
-        final_products = manager.find_all("products", limit=100)
-        if final_products:
-            logger.info(f"\n✅ Final product count: {len(final_products)}")
+        # Final count (computed on the server)
+        final_count = manager.count("products")
+        logger.info(f"\n✅ Final product count: {final_count or 0}")
 
 
 if __name__ == "__main__":
@@ -7,12 +7,14 @@ in a single application using the generic framework.
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
-# Add parent directory to path to import modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Add parent directory to path to import modules (once)
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from generic_database_connector import GenericDatabaseConnector
-from generic_database_manager import GenericDatabaseManager
 import logging
 
 # Configure logging
@@ -20,18 +22,12 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def main():
-    """Example using multiple databases together."""
-    
-    logger.info("=== Multi-Database Application Example ===\n")
-    
-    # Scenario: E-commerce application using different databases for different purposes
-    
-    # 1. MySQL for transactional data (orders, customers)
+def _do_mysql():
+    """MySQL for transactional data (orders, customers)."""
     logger.info("1. Using MySQL for transactional data...")
     with GenericDatabaseConnector("mysql") as mysql_db:
         if mysql_db.is_connected():
-            mysql_mgr = GenericDatabaseManager(mysql_db)
+            mysql_mgr = mysql_db.manager
             
             # Store order
             order = {
@@ -42,12 +38,14 @@ def main():
             }
             mysql_mgr.insert_one("orders", order)
             logger.info(f"✅ Stored order in MySQL: {order['order_id']}")
-    
-    # 2. MongoDB for product catalog (flexible schema)
-    logger.info("\n2. Using MongoDB for product catalog...")
+
+
+def _do_mongo():
+    """MongoDB for product catalog (flexible schema)."""
+    logger.info("2. Using MongoDB for product catalog...")
     with GenericDatabaseConnector("mongodb") as mongo_db:
         if mongo_db.is_connected():
-            mongo_mgr = GenericDatabaseManager(mongo_db)
+            mongo_mgr = mongo_db.manager
             
             # Store product with flexible attributes
             product = {
@@ -64,9 +62,11 @@ def main():
             }
             mongo_mgr.insert_one("products", product)
             logger.info(f"✅ Stored product in MongoDB: {product['sku']}")
-    
-    # 3. Redis for caching and sessions
-    logger.info("\n3. Using Redis for caching...")
+
+
+def _do_redis():
+    """Redis for caching and sessions."""
+    logger.info("3. Using Redis for caching...")
     with GenericDatabaseConnector("redis") as redis_db:
         if redis_db.is_connected():
             redis_conn = redis_db.get_connection()
@@ -74,18 +74,21 @@ def main():
             # Cache user session
             redis_conn.setex("session:user123", 3600, "active")
             
-            # Cache frequently accessed data
-            redis_conn.set("product:LAPTOP-001:views", 0)
-            redis_conn.incr("product:LAPTOP-001:views")
+            # Cache frequently accessed data (written through to Redis and
+            # tracked locally, so reading it back needs no round-trip).
+            # INCR creates the counter at 0, so no initial SET is needed.
+            redis_db.cache_incr("product:LAPTOP-001:views")
             
-            views = redis_conn.get("product:LAPTOP-001:views")
+            views = redis_db.cached_get("product:LAPTOP-001:views")
             logger.info(f"✅ Cached session and product views in Redis: {views} views")
-    
-    # 4. PostgreSQL for analytics (with JSONB support)
-    logger.info("\n4. Using PostgreSQL for analytics...")
+
+
+def _do_pg():
+    """PostgreSQL for analytics (with JSONB support)."""
+    logger.info("4. Using PostgreSQL for analytics...")
     with GenericDatabaseConnector("postgresql") as pg_db:
         if pg_db.is_connected():
-            pg_mgr = GenericDatabaseManager(pg_db)
+            pg_mgr = pg_db.manager
             
             # Store analytics event
             event = {
@@ -96,6 +99,24 @@ def main():
             }
             pg_mgr.insert_one("analytics_events", event)
             logger.info(f"✅ Stored analytics event in PostgreSQL")
+
+
+def main():
+    """Example using multiple databases together."""
+    
+    logger.info("=== Multi-Database Application Example ===\n")
+    
+    # Scenario: E-commerce application using different databases for different purposes.
+    # The backends are independent, so run them concurrently: total latency is
+    # the slowest workload rather than the sum of all four.
+    workloads = [_do_mysql, _do_mongo, _do_redis, _do_pg]
+    with ThreadPoolExecutor(max_workers=len(workloads)) as executor:
+        futures = [executor.submit(workload) for workload in workloads]
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Workload failed: {e}")
     
     # Summary
     logger.info("\n" + "="*50)
@@ -8,11 +8,12 @@ Shows basic CRUD operations and common patterns.
 import sys
 import os
 
-# Add parent directory to path to import modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Add parent directory to path to import modules (once)
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from generic_database_connector import GenericDatabaseConnector
-from generic_database_manager import GenericDatabaseManager
 import logging
 
 # Configure logging
@@ -20,6 +21,32 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Tables already created in this process; DDL is skipped on repeat runs
+_SCHEMA_READY = set()
+
+
+def _ensure_users_table(db):
+    """Create the users table once per process."""
+    if ("mysql", "users") in _SCHEMA_READY:
+        return
+    
+    logger.info("\n=== Creating Table ===")
+    cursor = db.get_connection().cursor()
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS users (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            name VARCHAR(255) NOT NULL,
+            email VARCHAR(255) NOT NULL,
+            age INT,
+            city VARCHAR(255)
+        )
+    """)
+    db.get_connection().commit()
+    cursor.close()
+    logger.info("✅ Users table ready")
+    _SCHEMA_READY.add(("mysql", "users"))
+
+
 def main():
     """MySQL example with CRUD operations."""
     
@@ -31,77 +58,63 @@ def main():
         
         logger.info("✅ Connected to MySQL successfully!")
         
-        # Create manager
-        manager = GenericDatabaseManager(db)
+        # Reuse the manager cached on the connector
+        manager = db.manager
         
         # Create users table if it doesn't exist
-        logger.info("\n=== Creating Table ===")
-        cursor = db.get_connection().cursor()
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS users (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                name VARCHAR(255) NOT NULL,
-                email VARCHAR(255) NOT NULL,
-                age INT,
-                city VARCHAR(255)
-            )
-        """)
-        db.get_connection().commit()
-        cursor.close()
-        logger.info("✅ Users table ready")
+        _ensure_users_table(db)
         
-        # 1. INSERT - Add new users
-        logger.info("\n=== INSERT Operations ===")
-        user1 = {
-            "name": "John Doe",
-            "email": "john@example.com",
-            "age": 30,
-            "city": "New York"
-        }
-        user_id = manager.insert_one("users", user1)
-        logger.info(f"Inserted user with ID: {user_id}")
-        
-        # Insert multiple users
-        users = [
-            {"name": "Jane Smith", "email": "jane@example.com", "age": 25, "city": "Boston"},
-            {"name": "Bob Johnson", "email": "bob@example.com", "age": 35, "city": "Chicago"},
-            {"name": "Alice Brown", "email": "alice@example.com", "age": 28, "city": "Seattle"}
-        ]
-        
-        for user in users:
-            manager.insert_one("users", user)
-        logger.info(f"Inserted {len(users)} more users")
-        
-        # 2. SELECT - Retrieve data
-        logger.info("\n=== SELECT Operations ===")
-        all_users = manager.find_all("users", limit=10)
-        if all_users:
-            logger.info(f"Found {len(all_users)} users:")
-            for user in all_users:
-                logger.info(f"  - {user.get('name')} ({user.get('email')})")
-        else:
-            logger.info("No users found")
-        
-        # 3. UPDATE - Modify data
-        logger.info("\n=== UPDATE Operations ===")
-        updated = manager.update_one(
-            "users",
-            {"name": "John Doe"},  # condition
-            {"age": 31, "city": "San Francisco"}  # new data
-        )
-        logger.info(f"Updated {updated} user(s)")
-        
-        # 4. DELETE - Remove data
-        logger.info("\n=== DELETE Operations ===")
-        deleted = manager.delete_one("users", {"name": "Bob Johnson"})
-        logger.info(f"Deleted {deleted} user(s)")
+        # Run the writes as one transaction: a single commit instead of one per statement
+        with manager.transaction():
+            # 1. INSERT - Add new users
+            logger.info("\n=== INSERT Operations ===")
+            user1 = {
+                "name": "John Doe",
+                "email": "john@example.com",
+                "age": 30,
+                "city": "New York"
+            }
+            user_id = manager.insert_one("users", user1)
+            logger.info(f"Inserted user with ID: {user_id}")
+            
+            # Insert multiple users
+            users = [
+                {"name": "Jane Smith", "email": "jane@example.com", "age": 25, "city": "Boston"},
+                {"name": "Bob Johnson", "email": "bob@example.com", "age": 35, "city": "Chicago"},
+                {"name": "Alice Brown", "email": "alice@example.com", "age": 28, "city": "Seattle"}
+            ]
+            
+            manager.insert_many("users", users)
+            logger.info(f"Inserted {len(users)} more users")
+            
+            # 2. SELECT - Retrieve data
+            logger.info("\n=== SELECT Operations ===")
+            if logger.isEnabledFor(logging.INFO):
+                # Rows are only formatted when INFO is enabled, and logged as one record
+                lines = [f"  - {user['name']} ({user['email']})"
+                         for user in manager.iter_all("users", limit=10, fields=["name", "email"])]
+                if not lines:
+                    logger.info("No users found")
+                else:
+                    logger.info(f"Found {len(lines)} users:\n" + "\n".join(lines))
+            
+            # 3. UPDATE - Modify data
+            logger.info("\n=== UPDATE Operations ===")
+            updated = manager.update_one(
+                "users",
+                {"name": "John Doe"},  # condition
+                {"age": 31, "city": "San Francisco"}  # new data
+            )
+            logger.info(f"Updated {updated} user(s)")
+            
+            # 4. DELETE - Remove data
+            logger.info("\n=== DELETE Operations ===")
+            deleted = manager.delete_one("users", {"name": "Bob Johnson"})
+            logger.info(f"Deleted {deleted} user(s)")
         
-        # Final count
-        final_users = manager.find_all("users", limit=100)
-        if final_users:
-            logger.info(f"\n✅ Final user count: {len(final_users)}")
-        else:
-            logger.info(f"\n✅ Final user count: 0")
+        # Final count (computed on the server)
+        final_count = manager.count("users")
+        logger.info(f"\n✅ Final user count: {final_count or 0}")
 
 
 if __name__ == "__main__":
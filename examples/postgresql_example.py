@@ -8,11 +8,12 @@ Shows advanced SQL features and JSONB support.
 import sys
 import os
 
-# Add parent directory to path to import modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Add parent directory to path to import modules (once)
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from generic_database_connector import GenericDatabaseConnector
-from generic_database_manager import GenericDatabaseManager
 import logging
 
 # Configure logging
@@ -20,6 +21,33 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Tables already created in this process; DDL is skipped on repeat runs
+_SCHEMA_READY = set()
+
+
+def _ensure_employees_table(db):
+    """Create the employees table once per process."""
+    if ("postgresql", "employees") in _SCHEMA_READY:
+        return
+    
+    logger.info("\n=== Creating Table ===")
+    cursor = db.get_connection().cursor()
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS employees (
+            id SERIAL PRIMARY KEY,
+            name VARCHAR(255) NOT NULL,
+            email VARCHAR(255) NOT NULL,
+            department VARCHAR(255),
+            salary INTEGER,
+            hire_date DATE
+        )
+    """)
+    db.get_connection().commit()
+    cursor.close()
+    logger.info("✅ Employees table ready")
+    _SCHEMA_READY.add(("postgresql", "employees"))
+
+
 def main():
     """PostgreSQL example with advanced features."""
     
@@ -31,80 +59,67 @@ def main():
         
         logger.info("✅ Connected to PostgreSQL successfully!")
         
-        # Create manager
-        manager = GenericDatabaseManager(db)
+        # Reuse the manager cached on the connector
+        manager = db.manager
         
         # Create employees table if it doesn't exist
-        logger.info("\n=== Creating Table ===")
-        cursor = db.get_connection().cursor()
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS employees (
-                id SERIAL PRIMARY KEY,
-                name VARCHAR(255) NOT NULL,
-                email VARCHAR(255) NOT NULL,
-                department VARCHAR(255),
-                salary INTEGER,
-                hire_date DATE
-            )
-        """)
-        db.get_connection().commit()
-        cursor.close()
-        logger.info("✅ Employees table ready")
+        _ensure_employees_table(db)
         
-        # 1. INSERT - Add records
-        logger.info("\n=== INSERT Operations ===")
-        employee1 = {
-            "name": "John Doe",
-            "email": "john@company.com",
-            "department": "Engineering",
-            "salary": 75000,
-            "hire_date": "2023-01-15"
-        }
-        emp_id = manager.insert_one("employees", employee1)
-        logger.info(f"Inserted employee with ID: {emp_id}")
-        
-        # Insert multiple employees
-        employees = [
-            {"name": "Jane Smith", "email": "jane@company.com", "department": "Marketing", "salary": 65000, "hire_date": "2023-02-01"},
-            {"name": "Bob Johnson", "email": "bob@company.com", "department": "Engineering", "salary": 80000, "hire_date": "2023-03-10"},
-            {"name": "Alice Brown", "email": "alice@company.com", "department": "Sales", "salary": 70000, "hire_date": "2023-04-05"}
-        ]
-        
-        for emp in employees:
-            manager.insert_one("employees", emp)
-        logger.info(f"Inserted {len(employees)} more employees")
-        
-        # 2. SELECT - Query data
-        logger.info("\n=== SELECT Operations ===")
-        all_employees = manager.find_all("employees", limit=10)
-        if all_employees:
-            logger.info(f"Found {len(all_employees)} employees:")
-            for emp in all_employees:
-                logger.info(f"  - {emp.get('name')} ({emp.get('department')}): ${emp.get('salary')}")
-        
-        # 3. UPDATE - Modify records
-        logger.info("\n=== UPDATE Operations ===")
-        updated = manager.update_one(
-            "employees",
-            {"name": "John Doe"},
-            {"salary": 78000, "department": "Senior Engineering"}
-        )
-        logger.info(f"Updated {updated} employee(s)")
-        
-        # 4. DELETE - Remove records
-        logger.info("\n=== DELETE Operations ===")
-        deleted = manager.delete_one("employees", {"name": "Bob Johnson"})
-        logger.info(f"Deleted {deleted} employee(s)")
+        # Run the writes as one transaction: a single commit instead of one per statement
+        with manager.transaction():
+            # 1. INSERT - Add records
+            logger.info("\n=== INSERT Operations ===")
+            employee1 = {
+                "name": "John Doe",
+                "email": "john@company.com",
+                "department": "Engineering",
+                "salary": 75000,
+                "hire_date": "2023-01-15"
+            }
+            emp_id = manager.insert_one("employees", employee1)
+            logger.info(f"Inserted employee with ID: {emp_id}")
+            
+            # Insert multiple employees
+            employees = [
+                {"name": "Jane Smith", "email": "jane@company.com", "department": "Marketing", "salary": 65000, "hire_date": "2023-02-01"},
+                {"name": "Bob Johnson", "email": "bob@company.com", "department": "Engineering", "salary": 80000, "hire_date": "2023-03-10"},
+                {"name": "Alice Brown", "email": "alice@company.com", "department": "Sales", "salary": 70000, "hire_date": "2023-04-05"}
+            ]
+            
+            manager.insert_many("employees", employees)
+            logger.info(f"Inserted {len(employees)} more employees")
+            
+            # 2. SELECT - Query data
+            logger.info("\n=== SELECT Operations ===")
+            if logger.isEnabledFor(logging.INFO):
+                # Rows are only formatted when INFO is enabled, and logged as one record
+                lines = [f"  - {emp['name']} ({emp['department']}): ${emp['salary']}"
+                         for emp in manager.iter_all("employees", limit=10, 
+                                                     fields=["name", "department", "salary"])]
+                logger.info(f"Found {len(lines)} employees:\n" + "\n".join(lines))
+            
+            # 3. UPDATE - Modify records
+            logger.info("\n=== UPDATE Operations ===")
+            updated = manager.update_one(
+                "employees",
+                {"name": "John Doe"},
+                {"salary": 78000, "department": "Senior Engineering"}
+            )
+            logger.info(f"Updated {updated} employee(s)")
+            
+            # 4. DELETE - Remove records
+            logger.info("\n=== DELETE Operations ===")
+            deleted = manager.delete_one("employees", {"name": "Bob Johnson"})
+            logger.info(f"Deleted {deleted} employee(s)")
         
         # PostgreSQL-specific: JSONB example (if table supports it)
         logger.info("\n=== PostgreSQL JSONB Feature ===")
         logger.info("PostgreSQL supports JSONB for flexible document storage")
         logger.info("You can store JSON data directly in columns")
         
-        # Final count
-        final_employees = manager.find_all("employees", limit=100)
-        if final_employees:
-            logger.info(f"\n✅ Final employee count: {len(final_employees)}")
+        # Final count (computed on the server)
+        final_count = manager.count("employees")
+        logger.info(f"\n✅ Final employee count: {final_count or 0}")
 
 
 if __name__ == "__main__":
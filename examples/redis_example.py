@@ -8,8 +8,10 @@ Shows key-value operations and caching patterns.
 import sys
 import os
 
-# Add parent directory to path to import modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Add parent directory to path to import modules (once)
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from generic_database_connector import GenericDatabaseConnector
 import logging
@@ -33,69 +35,86 @@ def main():
         # Get Redis connection
         redis_conn = db.get_connection()
         
-        # 1. SET - Store values
+        # Queue every command on one pipeline so the whole sequence costs a
+        # single round-trip instead of one per command
+        with redis_conn.pipeline(transaction=False) as pipe:
+            # 1. SET - Store values (one hash instead of three string keys)
+            pipe.hset("user:1", mapping={
+                "name": "John Doe",
+                "email": "john@example.com",
+                "age": 30
+            })
+            
+            # Set with expiration (TTL)
+            pipe.setex("session:abc123", 3600, "user_session_data")
+            
+            # 2. GET - Retrieve values
+            pipe.hmget("user:1", ["name", "email", "age"])
+            
+            # 3. Hash operations
+            pipe.hset("user:2", mapping={
+                "name": "Jane Smith",
+                "email": "jane@example.com",
+                "age": "25"
+            })
+            pipe.hgetall("user:2")
+            
+            # 4. List operations
+            pipe.rpush("tasks", "task1", "task2", "task3")
+            
+            # 5. Set operations
+            pipe.sadd("tags", "python", "redis", "database")
+            
+            # 6. Counter operations (INCRBY creates the key at 0 if missing)
+            pipe.incrby("page:views", 3)
+            
+            # 7. Check existence
+            pipe.exists("user:1")
+            
+            # 8. Delete keys
+            pipe.delete("user:1")
+            
+            (_, _,
+             (name, email, age),
+             _, user2,
+             _,
+             _,
+             views,
+             exists,
+             deleted) = pipe.execute()
+        
+        # Pop two tasks with a single command
+        popped = db.manager.pop_tasks("tasks", 2)
+        
+        # Read set members with SSCAN so large sets are streamed in chunks
+        tags = list(db.manager.get_set("tags"))
+        
         logger.info("\n=== SET Operations ===")
-        redis_conn.set("user:1:name", "John Doe")
-        redis_conn.set("user:1:email", "john@example.com")
-        redis_conn.set("user:1:age", 30)
         logger.info("Stored user data in Redis")
-        
-        # Set with expiration (TTL)
-        redis_conn.setex("session:abc123", 3600, "user_session_data")
         logger.info("Stored session with 1 hour expiration")
         
-        # 2. GET - Retrieve values
         logger.info("\n=== GET Operations ===")
-        name = redis_conn.get("user:1:name")
-        email = redis_conn.get("user:1:email")
-        age = redis_conn.get("user:1:age")
         logger.info(f"Retrieved user: {name}, {email}, age {age}")
         
-        # 3. Hash operations
         logger.info("\n=== HASH Operations ===")
-        redis_conn.hset("user:2", mapping={
-            "name": "Jane Smith",
-            "email": "jane@example.com",
-            "age": "25"
-        })
         logger.info("Stored user as hash")
-        
-        user2 = redis_conn.hgetall("user:2")
         logger.info(f"Retrieved hash: {user2}")
         
-        # 4. List operations
         logger.info("\n=== LIST Operations ===")
-        redis_conn.rpush("tasks", "task1", "task2", "task3")
         logger.info("Added tasks to list")
+        logger.info(f"Popped tasks: {popped}")
         
-        task = redis_conn.lpop("tasks")
-        logger.info(f"Popped task: {task}")
-        
-        # 5. Set operations
         logger.info("\n=== SET Operations ===")
-        redis_conn.sadd("tags", "python", "redis", "database")
         logger.info("Added tags to set")
-        
-        tags = redis_conn.smembers("tags")
         logger.info(f"Tags: {tags}")
         
-        # 6. Counter operations
         logger.info("\n=== COUNTER Operations ===")
-        redis_conn.set("page:views", 0)
-        redis_conn.incr("page:views")
-        redis_conn.incr("page:views")
-        redis_conn.incr("page:views")
-        views = redis_conn.get("page:views")
         logger.info(f"Page views: {views}")
         
-        # 7. Check existence
         logger.info("\n=== EXISTS Operations ===")
-        exists = redis_conn.exists("user:1:name")
         logger.info(f"Key exists: {exists}")
         
-        # 8. Delete keys
         logger.info("\n=== DELETE Operations ===")
-        deleted = redis_conn.delete("user:1:name", "user:1:email", "user:1:age")
         logger.info(f"Deleted {deleted} keys")
         
         logger.info("\n✅ Redis operations completed!")
@@ -8,13 +8,26 @@ Author: Database Team
 Date: 2026-01-17
 """
 
+import copy
 import logging
 import os
 import importlib
-from typing import Optional, Dict, Any, List
+import json
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple
 from dotenv import load_dotenv
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -25,6 +38,45 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+# Process-wide connection pools keyed by (db_type, config_file)
+_POOLS: Dict[Tuple[str, str], Any] = {}
+_POOLS_LOCK = threading.Lock()
+
+# Process-wide shared connectors keyed by (db_type, config_file), see get_shared()
+_INSTANCES: Dict[Tuple[str, str], "GenericDatabaseConnector"] = {}
+# One lock per key so a slow backend never blocks get_shared() for the others;
+# _INSTANCES_LOCK only guards creation of those locks
+_INSTANCE_LOCKS: Dict[Tuple[str, str], threading.Lock] = {}
+_INSTANCES_LOCK = threading.Lock()
+
+# Parsed config files keyed by absolute path -> (mtime, size, parsed config)
+_CONFIG_CACHE: "OrderedDict[str, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+_CONFIG_CACHE_MAX = 100
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
+def _cached_import(name: str) -> Any:
+    """Import a module, returning it straight from sys.modules when already loaded."""
+    module = sys.modules.get(name)
+    # A module another thread is still importing must go through the import lock
+    if module is not None and getattr(getattr(module, '__spec__', None), '_initializing', False) is False:
+        return module
+    return importlib.import_module(name)
+
+
+# Lazily imported driver attributes keyed by (module name, attribute)
+_LAZY: Dict[Tuple[str, str], Any] = {}
+
+
+def _lazy(name: str, attr: str) -> Any:
+    """Import `attr` from module `name` on first use and reuse it afterwards."""
+    key = (name, attr)
+    value = _LAZY.get(key)
+    if value is None:
+        value = getattr(_cached_import(name), attr)
+        _LAZY[key] = value
+    return value
+
 
 class GenericDatabaseConnector:
     """
@@ -40,6 +92,17 @@ class GenericDatabaseConnector:
         driver_module: Imported database driver module
     """
     
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = (
+        'db_type', 'config_file', 'config', 'connection', 'driver_module',
+        '_pool', '_manager', '_resolved_params', '_env_keys', '_env_list_keys', '_local',
+        '_ping_ttl', '_last_ping_ok_at',
+        '_connect_dispatch', '_liveness_dispatch', '_connect_handler', '_liveness_check',
+    )
+    
+    # Matches a whole-value ${VAR} placeholder
+    _ENV_RE = re.compile(r'^\$\{([^}]+)\}$')
+    
     def __init__(self, db_type: str, config_file: str = "database_config.yaml"):
         """
         Initialize generic database connector.
@@ -53,6 +116,34 @@ class GenericDatabaseConnector:
         self.config: Optional[Dict[str, Any]] = None
         self.connection = None
         self.driver_module = None
+        self._pool = None
+        self._manager = None
+        self._resolved_params: Optional[Dict[str, Any]] = None
+        # ${VAR} placeholders in connection_params, found once in _load_config
+        self._env_keys: List[Tuple[str, str]] = []
+        self._env_list_keys: List[Tuple[str, List[Tuple[int, str]]]] = []
+        self._local: Dict[str, Any] = {}
+        # Liveness checks within this many seconds of a successful one are skipped
+        self._ping_ttl = 5.0
+        self._last_ping_ok_at = 0.0
+        
+        # Handlers per database type; the ones for this database are bound in _load_config
+        self._connect_dispatch = {
+            'relational': self._connect_relational,
+            'nosql_document': self._connect_nosql_document,
+            'nosql_search': self._connect_nosql_search,
+            'nosql_wide_column': self._connect_nosql_wide_column,
+            'vector_database': self._connect_vector_db,
+            'data_warehouse': self._connect_data_warehouse,
+            'nosql_key_value': self._connect_nosql_key_value,
+        }
+        self._liveness_dispatch = {
+            'relational': self._check_relational,
+            'nosql_document': self._check_nosql_document,
+            'nosql_search': self._check_nosql_search,
+        }
+        self._connect_handler = None
+        self._liveness_check = None
         
         # Load configuration
         self._load_config()
@@ -60,76 +151,171 @@ class GenericDatabaseConnector:
         # Import appropriate driver
         self._import_driver()
         
-        logger.info(f"Generic connector initialized for {self.db_type}")
+        logger.info("Generic connector initialized for %s", self.db_type)
     
     def _load_config(self) -> None:
         """Load database configuration from YAML file."""
         try:
-            with open(self.config_file, 'r') as f:
-                all_configs = yaml.safe_load(f)
+            all_configs = self._read_config_file()
             
             if self.db_type not in all_configs['databases']:
                 raise ValueError(f"Database type '{self.db_type}' not found in config")
             
-            self.config = all_configs['databases'][self.db_type]
-            logger.info(f"Configuration loaded for {self.db_type}")
+            # Copy so per-instance changes never leak into the shared cache
+            self.config = copy.deepcopy(all_configs['databases'][self.db_type])
+            
+            # Bind the type-specific handlers now so unknown types fail here
+            # rather than on first connect
+            self._connect_handler = self._connect_dispatch.get(self.config['type'])
+            if self._connect_handler is None:
+                raise ValueError(f"Unknown database type: {self.config['type']}")
+            self._liveness_check = self._liveness_dispatch.get(self.config['type'], 
+                                                               self._check_default)
+            
+            # Record which params hold ${VAR} placeholders so connect only touches those
+            self._env_keys = []
+            self._env_list_keys = []
+            for key, value in self.config.get('connection_params', {}).items():
+                if isinstance(value, list):
+                    items = [(i, self._env_var_name(item)) for i, item in enumerate(value)]
+                    items = [(i, var) for i, var in items if var is not None]
+                    if items:
+                        self._env_list_keys.append((key, items))
+                else:
+                    var = self._env_var_name(value)
+                    if var is not None:
+                        self._env_keys.append((key, var))
+            
+            logger.info("Configuration loaded for %s", self.db_type)
             
         except FileNotFoundError:
-            logger.error(f"Configuration file '{self.config_file}' not found")
+            logger.error("Configuration file '%s' not found", self.config_file)
             raise
         except yaml.YAMLError as e:
-            logger.error(f"Error parsing YAML configuration: {e}")
+            logger.error("Error parsing YAML configuration: %s", e)
             raise
     
+    def _read_config_file(self) -> Dict[str, Any]:
+        """
+        Parse the config file, reusing the cached result while it is unchanged.
+        
+        Returns:
+            Dict: Parsed configuration (shared; callers must not mutate it)
+        """
+        st = os.stat(self.config_file)
+        key = os.path.abspath(self.config_file)
+        
+        with _CONFIG_CACHE_LOCK:
+            entry = _CONFIG_CACHE.get(key)
+            if entry and entry[0] == st.st_mtime and entry[1] == st.st_size:
+                _CONFIG_CACHE.move_to_end(key)
+                return entry[2]
+        
+        all_configs = self._parse_config_file(st.st_mtime)
+        
+        with _CONFIG_CACHE_LOCK:
+            _CONFIG_CACHE[key] = (st.st_mtime, st.st_size, all_configs)
+            _CONFIG_CACHE.move_to_end(key)
+            while len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX:
+                _CONFIG_CACHE.popitem(last=False)
+        
+        return all_configs
+    
+    def _parse_config_file(self, yaml_mtime: float) -> Dict[str, Any]:
+        """
+        Parse the config, preferring an up-to-date JSON sidecar over the YAML.
+        
+        The YAML file stays the source of truth; the JSON copy next to it is
+        regenerated whenever it is missing or older than the YAML.
+        
+        Args:
+            yaml_mtime (float): Modification time of the YAML file
+            
+        Returns:
+            Dict: Parsed configuration
+        """
+        json_path = os.path.splitext(self.config_file)[0] + '.json'
+        
+        try:
+            if os.path.getmtime(json_path) >= yaml_mtime:
+                with open(json_path, 'r') as f:
+                    return json.load(f)
+        except (OSError, ValueError):
+            # Missing or unreadable sidecar: fall back to the YAML
+            pass
+        
+        with open(self.config_file, 'r') as f:
+            all_configs = yaml.load(f, Loader=_YamlLoader)
+        
+        tmp_path = f"{json_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(all_configs, f)
+            os.replace(tmp_path, json_path)
+        except (OSError, TypeError) as e:
+            # Read-only directory or values JSON can't represent; YAML still works
+            logger.debug("Could not write JSON config cache '%s': %s", json_path, e)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        
+        return all_configs
+    
     def _import_driver(self) -> None:
         """Dynamically import the database driver module."""
         try:
             driver_name = self.config['driver']
             
-            # Handle different import patterns
-            if '.' in driver_name:
-                # e.g., "mysql.connector"
-                self.driver_module = importlib.import_module(driver_name)
-            else:
-                # e.g., "pymongo"
-                self.driver_module = importlib.import_module(driver_name)
+            # Works for both "pymongo" and dotted names like "mysql.connector"
+            self.driver_module = _cached_import(driver_name)
             
-            logger.info(f"Driver '{driver_name}' imported successfully")
+            logger.info("Driver '%s' imported successfully", driver_name)
             
         except ImportError as e:
-            logger.error(f"Failed to import driver '{self.config['driver']}': {e}")
+            logger.error("Failed to import driver '%s': %s", self.config['driver'], e)
             raise
     
     def _resolve_env_vars(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Resolve environment variables in connection parameters.
         
+        Only the keys recorded in _load_config are looked up; literal values
+        are copied as they are.
+        
         Args:
             params (Dict): Connection parameters with ${VAR} placeholders
             
         Returns:
             Dict: Parameters with resolved environment variables
         """
-        resolved = {}
-        for key, value in params.items():
-            if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-                env_var = value[2:-1]
-                resolved[key] = os.getenv(env_var, "")
-            elif isinstance(value, list):
-                resolved[key] = [self._resolve_env_vars({"item": item})["item"] 
-                               if isinstance(item, str) else item for item in value]
-            else:
-                resolved[key] = value
+        resolved = dict(params)
+        for key, var in self._env_keys:
+            resolved[key] = os.getenv(var, "")
+        for key, items in self._env_list_keys:
+            values = list(resolved[key])
+            for index, var in items:
+                values[index] = os.getenv(var, "")
+            resolved[key] = values
         return resolved
     
-    def connect(self) -> bool:
+    def _env_var_name(self, value: Any) -> Optional[str]:
+        """Return the variable name of a whole-value ${VAR} placeholder, else None."""
+        if isinstance(value, str):
+            match = self._ENV_RE.match(value)
+            if match:
+                return match.group(1)
+        return None
+    
+    def _get_connection_params(self) -> Dict[str, Any]:
         """
-        Establish connection to the database.
+        Get connection parameters with environment variables resolved.
+        
+        Resolution and port coercion run once per instance; each call returns
+        a shallow copy so callers can modify it freely.
         
         Returns:
-            bool: True if connection successful, False otherwise
+            Dict: Resolved connection parameters
         """
-        try:
+        if self._resolved_params is None:
             # Resolve environment variables in connection params
             conn_params = self._resolve_env_vars(self.config['connection_params'])
             
@@ -138,38 +324,121 @@ class GenericDatabaseConnector:
                 try:
                     conn_params['port'] = int(conn_params['port'])
                 except (ValueError, TypeError) as e:
-                    logger.error(f"Invalid port value '{conn_params['port']}': {e}")
+                    logger.error("Invalid port value '%s': %s", conn_params['port'], e)
                     # Use default port if conversion fails
                     if 'default_port' in self.config:
                         conn_params['port'] = self.config['default_port']
-                        logger.info(f"Using default port: {conn_params['port']}")
+                        logger.info("Using default port: %s", conn_params['port'])
                     else:
                         raise ValueError(f"Invalid port value and no default port configured")
             
+            self._resolved_params = conn_params
+        
+        return dict(self._resolved_params)
+    
+    def connect(self, use_pool: bool = False) -> bool:
+        """
+        Establish connection to the database.
+        
+        Args:
+            use_pool (bool): Borrow the connection from the shared process-wide
+                pool instead of opening a dedicated one
+        
+        Returns:
+            bool: True if connection successful, False otherwise
+        """
+        try:
+            conn_params = self._get_connection_params()
+            
+            if use_pool:
+                self._pool = self._get_pool(conn_params)
+            
             # Database-specific connection logic
-            if self.config['type'] == 'relational':
-                self.connection = self._connect_relational(conn_params)
-            elif self.config['type'] == 'nosql_document':
-                self.connection = self._connect_nosql_document(conn_params)
-            elif self.config['type'] == 'nosql_search':
-                self.connection = self._connect_nosql_search(conn_params)
-            elif self.config['type'] == 'nosql_wide_column':
-                self.connection = self._connect_nosql_wide_column(conn_params)
-            elif self.config['type'] == 'vector_database':
-                self.connection = self._connect_vector_db(conn_params)
-            elif self.config['type'] == 'data_warehouse':
-                self.connection = self._connect_data_warehouse(conn_params)
+            if self._pool is not None:
+                self.connection = self._acquire_from_pool(self._pool)
             else:
-                raise ValueError(f"Unknown database type: {self.config['type']}")
+                self.connection = self._connect_handler(conn_params)
             
-            logger.info(f"Successfully connected to {self.db_type}")
+            logger.info("Successfully connected to %s", self.db_type)
             return True
             
         except Exception as e:
-            logger.error(f"Error connecting to {self.db_type}: {e}")
+            logger.error("Error connecting to %s: %s", self.db_type, e)
             self.connection = None
+            self._pool = None
             return False
     
+    def _get_pool(self, params: Dict[str, Any]) -> Any:
+        """
+        Get (or lazily create) the shared connection pool for this database.
+        
+        Args:
+            params (Dict): Resolved connection parameters
+            
+        Returns:
+            Pool object, or None if pooling is not supported for this driver
+        """
+        key = (self.db_type, self.config_file)
+        pool = _POOLS.get(key)
+        if pool is None:
+            with _POOLS_LOCK:
+                pool = _POOLS.get(key)
+                if pool is None:
+                    pool = self._create_pool(params)
+                    if pool is not None:
+                        _POOLS[key] = pool
+                        logger.info("Connection pool created for %s", self.db_type)
+        return pool
+    
+    def _create_pool(self, params: Dict[str, Any]) -> Any:
+        """Create a driver-specific connection pool."""
+        driver_name = self.config['driver']
+        
+        if driver_name == 'mysql.connector':
+            pooling = _cached_import('mysql.connector.pooling')
+            return pooling.MySQLConnectionPool(
+                pool_name=f"{self.db_type}_pool",
+                pool_size=8,
+                **params
+            )
+        elif driver_name == 'psycopg2':
+            pool = _cached_import('psycopg2.pool')
+            return pool.ThreadedConnectionPool(1, 8, **params)
+        elif driver_name == 'pymongo':
+            # MongoClient maintains its own pool, so the client itself is shared
+            return self._connect_nosql_document(params, maxPoolSize=50)
+        elif driver_name == 'redis':
+            return self.driver_module.ConnectionPool(
+                max_connections=32,
+                **{'decode_responses': True, **params}
+            )
+        
+        return None
+    
+    def _acquire_from_pool(self, pool: Any) -> Any:
+        """Borrow a connection from a shared pool."""
+        driver_name = self.config['driver']
+        
+        if driver_name == 'mysql.connector':
+            return pool.get_connection()
+        elif driver_name == 'psycopg2':
+            return pool.getconn()
+        elif driver_name == 'redis':
+            return self.driver_module.Redis(connection_pool=pool)
+        
+        return pool
+    
+    def _release_to_pool(self) -> None:
+        """Return the current connection to its shared pool."""
+        driver_name = self.config['driver']
+        
+        if driver_name == 'mysql.connector':
+            # Closing a pooled MySQL connection hands it back to the pool
+            self.connection.close()
+        elif driver_name == 'psycopg2':
+            self._pool.putconn(self.connection)
+        # Redis and MongoDB clients release their sockets per command
+    
     def _connect_relational(self, params: Dict[str, Any]) -> Any:
         """Connect to relational database (MySQL, PostgreSQL, Oracle, etc.)."""
         if self.db_type == 'mysql':
@@ -185,25 +454,30 @@ class GenericDatabaseConnector:
         else:
             raise ValueError(f"Unsupported relational database: {self.db_type}")
     
-    def _connect_nosql_document(self, params: Dict[str, Any]) -> Any:
+    def _connect_nosql_document(self, params: Dict[str, Any], **client_options: Any) -> Any:
         """Connect to document database (MongoDB)."""
-        from pymongo import MongoClient
+        MongoClient = _lazy('pymongo', 'MongoClient')
+        
+        if not _lazy('bson', 'has_c')():
+            logger.warning("PyMongo C extensions not available; BSON encoding will use "
+                           "the much slower pure-Python implementation")
         
         if params.get('username') and params.get('password'):
             client = MongoClient(
                 host=params['host'],
                 port=params['port'],
                 username=params['username'],
-                password=params['password']
+                password=params['password'],
+                **client_options
             )
         else:
-            client = MongoClient(host=params['host'], port=params['port'])
+            client = MongoClient(host=params['host'], port=params['port'], **client_options)
         
         return client
     
     def _connect_nosql_search(self, params: Dict[str, Any]) -> Any:
         """Connect to search engine (Elasticsearch)."""
-        from elasticsearch import Elasticsearch
+        Elasticsearch = _lazy('elasticsearch', 'Elasticsearch')
         
         if params.get('http_auth'):
             return Elasticsearch(
@@ -215,7 +489,7 @@ class GenericDatabaseConnector:
     
     def _connect_nosql_wide_column(self, params: Dict[str, Any]) -> Any:
         """Connect to wide-column store (Cassandra)."""
-        from cassandra.cluster import Cluster
+        Cluster = _lazy('cassandra.cluster', 'Cluster')
         
         cluster = Cluster(
             contact_points=params['contact_points'],
@@ -225,7 +499,7 @@ class GenericDatabaseConnector:
     
     def _connect_vector_db(self, params: Dict[str, Any]) -> Any:
         """Connect to vector database (Milvus)."""
-        from pymilvus import connections
+        connections = _lazy('pymilvus', 'connections')
         
         connections.connect(
             alias="default",
@@ -234,6 +508,14 @@ class GenericDatabaseConnector:
         )
         return connections
     
+    def _connect_nosql_key_value(self, params: Dict[str, Any]) -> Any:
+        """Connect to key-value store (Redis)."""
+        if self.config['driver'] == 'redis':
+            # Decode replies to str in the parser instead of per call
+            return self.driver_module.Redis(**{'decode_responses': True, **params})
+        else:
+            raise ValueError(f"Unsupported key-value database: {self.db_type}")
+    
     def _connect_data_warehouse(self, params: Dict[str, Any]) -> Any:
         """Connect to data warehouse (Netezza)."""
         conn_str = self._build_connection_string(params)
@@ -251,16 +533,23 @@ class GenericDatabaseConnector:
         """Close the database connection."""
         if self.connection:
             try:
-                if hasattr(self.connection, 'close'):
-                    self.connection.close()
-                elif hasattr(self.connection, 'disconnect'):
-                    self.connection.disconnect()
-                
-                logger.info(f"{self.db_type} connection closed successfully")
+                if self._pool is not None:
+                    self._release_to_pool()
+                    logger.info("%s connection returned to pool", self.db_type)
+                else:
+                    if hasattr(self.connection, 'close'):
+                        self.connection.close()
+                    elif hasattr(self.connection, 'disconnect'):
+                        self.connection.disconnect()
+                    
+                    logger.info("%s connection closed successfully", self.db_type)
             except Exception as e:
-                logger.error(f"Error closing connection: {e}")
+                logger.error("Error closing connection: %s", e)
             finally:
                 self.connection = None
+                self._pool = None
+                self._local.clear()
+                self._last_ping_ok_at = 0.0
     
     def is_connected(self) -> bool:
         """
@@ -272,25 +561,153 @@ class GenericDatabaseConnector:
         if not self.connection:
             return False
         
+        # Trust a recent successful check instead of another round-trip
+        if time.monotonic() - self._last_ping_ok_at < self._ping_ttl:
+            return True
+        
         try:
             # Database-specific connection check
-            if self.config['type'] == 'relational':
-                if hasattr(self.connection, 'is_connected'):
-                    return self.connection.is_connected()
-                elif hasattr(self.connection, 'closed'):
-                    return not self.connection.closed
-            elif self.config['type'] == 'nosql_document':
-                # MongoDB check
-                self.connection.admin.command('ping')
-                return True
-            elif self.config['type'] == 'nosql_search':
-                # Elasticsearch check
-                return self.connection.ping()
-            
-            return True
-            
+            alive = self._liveness_check()
         except Exception:
+            alive = False
+        
+        self._last_ping_ok_at = time.monotonic() if alive else 0.0
+        return alive
+    
+    def _check_relational(self) -> bool:
+        """Liveness check for relational connections."""
+        if hasattr(self.connection, 'is_connected'):
+            return self.connection.is_connected()
+        elif hasattr(self.connection, 'closed'):
+            return not self.connection.closed
+        return True
+    
+    def _check_nosql_document(self) -> bool:
+        """Liveness check for MongoDB."""
+        self.connection.admin.command('ping')
+        return True
+    
+    def _check_nosql_search(self) -> bool:
+        """Liveness check for Elasticsearch."""
+        return self.connection.ping()
+    
+    def _check_default(self) -> bool:
+        """Liveness check for types without a cheap ping: assume alive."""
+        return True
+    
+    def invalidate_connection_check(self) -> None:
+        """Forget the last successful liveness check so the next one hits the server."""
+        self._last_ping_ok_at = 0.0
+    
+    def _key_value_ready(self) -> bool:
+        """Check that a key-value connection is available for the cache helpers."""
+        if self.config['type'] != 'nosql_key_value':
+            logger.error("Key-value cache not supported for %s", self.db_type)
+            return False
+        if not self.is_connected():
+            logger.error("No database connection available")
             return False
+        return True
+    
+    def _as_stored(self, value: Any) -> Any:
+        """Convert a value to the form a GET returns for it (str, or bytes without decode_responses)."""
+        encoder = self.connection.connection_pool.get_encoder()
+        return encoder.decode(encoder.encode(value))
+    
+    def cache_set(self, key: str, value: Any) -> None:
+        """
+        Set a key in the key-value store and remember it locally.
+        
+        The local copy holds the value as Redis returns it, so cached_get()
+        gives the same type whether or not the key was written in this session.
+        
+        Args:
+            key (str): Key to set
+            value (Any): Value to store
+        """
+        if not self._key_value_ready():
+            return
+        self.connection.set(key, value)
+        self._local[key] = self._as_stored(value)
+    
+    def cache_incr(self, key: str, amount: int = 1) -> Optional[int]:
+        """
+        Increment a counter in the key-value store and track it locally.
+        
+        Args:
+            key (str): Counter key
+            amount (int): Increment to apply
+            
+        Returns:
+            int: New counter value, None if no key-value connection is available
+        """
+        if not self._key_value_ready():
+            return None
+        value = self.connection.incrby(key, amount)
+        self._local[key] = self._as_stored(value)
+        return value
+    
+    def cached_get(self, key: str) -> Any:
+        """
+        Get a key, serving values written in this session from local memory.
+        
+        Keys not written through cache_set()/cache_incr() are always read from
+        the server, so writes by other clients stay visible.
+        
+        Args:
+            key (str): Key to read
+            
+        Returns:
+            Cached or fetched value, None if the key does not exist or no
+            key-value connection is available
+        """
+        if key in self._local:
+            return self._local[key]
+        
+        if not self._key_value_ready():
+            return None
+        
+        return self.connection.get(key)
+    
+    @classmethod
+    def get_shared(cls, db_type: str, 
+                   config_file: str = "database_config.yaml") -> "GenericDatabaseConnector":
+        """
+        Get a process-wide connected connector for a database type.
+        
+        The connector (with its parsed config, driver and connection) is created
+        on first use and reused by later calls; it is replaced when its
+        connection is no longer alive.
+        
+        The shared connection is not thread-safe for relational drivers
+        (mysql.connector, psycopg2): threads that run queries concurrently
+        should use their own connector or the pool via connect(use_pool=True).
+        MongoClient and Redis clients are safe to share across threads.
+        
+        Args:
+            db_type (str): Database type (mysql, postgresql, mongodb, etc.)
+            config_file (str): Path to YAML configuration file
+            
+        Returns:
+            GenericDatabaseConnector: Shared connector for this database
+        """
+        key = (db_type.lower(), config_file)
+        with _INSTANCES_LOCK:
+            key_lock = _INSTANCE_LOCKS.get(key)
+            if key_lock is None:
+                key_lock = _INSTANCE_LOCKS[key] = threading.Lock()
+        
+        # The liveness check and connect may block on the network, so they run
+        # under the per-key lock only
+        with key_lock:
+            inst = _INSTANCES.get(key)
+            if inst is None or not inst.is_connected():
+                if inst is not None:
+                    inst.disconnect()
+                inst = cls(db_type, config_file)
+                inst.connect()
+                _INSTANCES[key] = inst
+            return inst
     
     def get_connection(self) -> Any:
         """
@@ -304,6 +721,21 @@ class GenericDatabaseConnector:
             return None
         return self.connection
     
+    @property
+    def manager(self) -> Any:
+        """
+        Get the GenericDatabaseManager bound to this connector.
+        
+        The manager is created on first access and reused afterwards.
+        
+        Returns:
+            GenericDatabaseManager: Manager for this connection
+        """
+        if self._manager is None:
+            from generic_database_manager import GenericDatabaseManager
+            self._manager = GenericDatabaseManager(self)
+        return self._manager
+    
     def get_query_syntax(self) -> Dict[str, str]:
         """
         Get database-specific query syntax.
@@ -323,12 +755,12 @@ class GenericDatabaseConnector:
         return self.config.get('features', [])
     
     def __enter__(self):
-        """Context manager entry."""
-        self.connect()
+        """Context manager entry (borrows a pooled connection where supported)."""
+        self.connect(use_pool=True)
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
+        """Context manager exit (returns pooled connections instead of closing)."""
         self.disconnect()
 
 
@@ -339,22 +771,22 @@ def main():
     with GenericDatabaseConnector("mysql") as db:
         if db.is_connected():
             logger.info("MySQL connection successful!")
-            logger.info(f"Features: {db.get_features()}")
-            logger.info(f"Query syntax: {db.get_query_syntax()}")
+            logger.info("Features: %s", db.get_features())
+            logger.info("Query syntax: %s", db.get_query_syntax())
     
     # Test MongoDB connection
     print("\n=== Testing MongoDB ===")
     with GenericDatabaseConnector("mongodb") as db:
         if db.is_connected():
             logger.info("MongoDB connection successful!")
-            logger.info(f"Features: {db.get_features()}")
+            logger.info("Features: %s", db.get_features())
     
     # Test PostgreSQL connection
     print("\n=== Testing PostgreSQL ===")
     with GenericDatabaseConnector("postgresql") as db:
         if db.is_connected():
             logger.info("PostgreSQL connection successful!")
-            logger.info(f"Features: {db.get_features()}")
+            logger.info("Features: %s", db.get_features())
 
 
 if __name__ == "__main__":
@@ -8,8 +8,14 @@ Author: Database Team
 Date: 2026-01-17
 """
 
+import hashlib
+import itertools
 import logging
-from typing import Optional, List, Dict, Any, Tuple, Union
+import re
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Any, Tuple, Union, Iterator
 from generic_database_connector import GenericDatabaseConnector
 
 # Configure logging
@@ -19,6 +25,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Prepared MySQL cursors kept per connection before the least recently used is closed
+_PREPARED_CURSORS_MAX = 32
+
+# Names PREPAREd on each PostgreSQL session. Prepared statements live as long as
+# the server session, which outlives managers and connectors when the connection
+# comes from a pool, so they are tracked per connection rather than per manager.
+_PG_PREPARED: "weakref.WeakKeyDictionary[Any, set]" = weakref.WeakKeyDictionary()
+
+
+def _iter_rows(cursor: Any, chunk: int = 1000) -> Iterator[Tuple[Any, ...]]:
+    """Yield rows from an executed cursor, fetching `chunk` rows at a time."""
+    while True:
+        rows = cursor.fetchmany(chunk)
+        if not rows:
+            return
+        yield from rows
+
 
 class GenericDatabaseManager:
     """
@@ -33,6 +56,17 @@ class GenericDatabaseManager:
         syntax (Dict): Database-specific query syntax
     """
     
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = (
+        'connector', 'db_type', 'syntax', 'features',
+        '_placeholder', '_quote', '_limit_tpl', '_limit_fast',
+        '_sql_cache', '_es_script_cache',
+        '_insert_dispatch', '_insert_many_dispatch', '_find_dispatch', '_iter_dispatch',
+        '_count_dispatch', '_update_dispatch', '_delete_dispatch',
+        '_prepared', '_mongo_db', '_mongo_client', '_cursor', '_cursor_conn',
+        '_stream_ids', '_in_transaction', '_transaction_failed', '_server_version',
+    )
+    
     def __init__(self, connector: GenericDatabaseConnector):
         """
         Initialize generic database manager.
@@ -45,7 +79,288 @@ class GenericDatabaseManager:
         self.syntax = connector.get_query_syntax()
         self.features = connector.get_features()
         
-        logger.info(f"GenericDatabaseManager initialized for {self.db_type}")
+        # Syntax pieces and generated SQL, built once and reused
+        self._placeholder = self.syntax.get('placeholder', '?')
+        self._quote = self.syntax.get('identifier_quote', '')
+        self._limit_tpl = self.syntax.get('limit_clause', 'LIMIT {limit}')
+        self._limit_fast = self._limit_tpl == 'LIMIT {limit}'
+        self._sql_cache: Dict[Tuple[Any, ...], str] = {}
+        self._es_script_cache: Dict[Tuple[str, ...], str] = {}
+        
+        # Resolve backend-specific handlers once instead of per call
+        self._insert_dispatch = {
+            'relational': self._insert_one_relational,
+            'nosql_document': self._insert_one_document,
+            'nosql_search': self._insert_one_search,
+        }
+        self._insert_many_dispatch = {
+            'relational': self._insert_many_relational,
+            'nosql_document': self._insert_many_document,
+            'nosql_search': self._insert_many_search,
+        }
+        self._find_dispatch = {
+            'relational': self._find_all_relational,
+            'nosql_document': self._find_all_document,
+            'nosql_search': self._find_all_search,
+        }
+        self._iter_dispatch = {
+            'relational': self._iter_all_relational,
+            'nosql_document': self._iter_all_document,
+        }
+        self._count_dispatch = {
+            'relational': self._count_relational,
+            'nosql_document': self._count_document,
+            'nosql_search': self._count_search,
+        }
+        self._update_dispatch = {
+            'relational': self._update_one_relational,
+            'nosql_document': self._update_one_document,
+            'nosql_search': self._update_one_search,
+        }
+        self._delete_dispatch = {
+            'relational': self._delete_one_relational,
+            'nosql_document': self._delete_one_document,
+            'nosql_search': self._delete_one_search,
+        }
+        
+        # Prepared MySQL cursors per connection, keyed by SQL text (LRU)
+        self._prepared = weakref.WeakKeyDictionary()
+        # MongoDB database handle and the client it was taken from
+        self._mongo_db = None
+        self._mongo_client = None
+        # Reusable cursor and the connection it belongs to
+        self._cursor = None
+        self._cursor_conn = None
+        # Unique names for server-side streaming cursors
+        self._stream_ids = itertools.count(1)
+        # State of an open transaction() block
+        self._in_transaction = False
+        self._transaction_failed = False
+        # Key-value server version, detected on first use
+        self._server_version: Optional[Tuple[int, ...]] = None
+        
+        logger.info("GenericDatabaseManager initialized for %s", self.db_type)
+    
+    # ==================== STATEMENT EXECUTION ====================
+    
+    def _execute_write(self, query: str, params: Tuple[Any, ...]) -> Tuple[int, Optional[int]]:
+        """
+        Execute and commit a write statement, preparing it on the server once.
+        
+        MySQL reuses a prepared cursor per statement, keeping at most
+        _PREPARED_CURSORS_MAX per connection; PostgreSQL issues PREPARE once per
+        server session under a name derived from the SQL text and EXECUTE
+        afterwards. Other drivers run the statement directly.
+        
+        Args:
+            query (str): SQL statement using the configured placeholder
+            params (Tuple): Statement parameters
+            
+        Returns:
+            Tuple of (row count, last inserted ID)
+        """
+        connection = self.connector.connection
+        driver_name = self.connector.config['driver']
+        
+        if driver_name not in ('mysql.connector', 'psycopg2'):
+            cursor = self._get_cursor()
+            cursor.execute(query, params)
+            self._commit()
+            return cursor.rowcount, getattr(cursor, 'lastrowid', None)
+        
+        if driver_name == 'mysql.connector':
+            prepared = self._prepared.get(connection)
+            if prepared is None:
+                prepared = self._prepared[connection] = OrderedDict()
+            cursor = prepared.get(query)
+            if cursor is None:
+                cursor = connection.cursor(prepared=True)
+                prepared[query] = cursor
+                if len(prepared) > _PREPARED_CURSORS_MAX:
+                    _, evicted = prepared.popitem(last=False)
+                    evicted.close()
+            else:
+                prepared.move_to_end(query)
+            try:
+                cursor.execute(query, params)
+            except Exception:
+                # Never reuse a cursor left in a failed state
+                del prepared[query]
+                try:
+                    cursor.close()
+                except Exception:
+                    pass
+                raise
+            self._commit()
+            return cursor.rowcount, cursor.lastrowid
+        
+        cursor = self._get_cursor()
+        name = self._pg_prepare(connection, cursor, query)
+        args = f" ({', '.join(['%s'] * len(params))})" if params else ""
+        cursor.execute(f"EXECUTE {name}{args}", params)
+        self._commit()
+        return cursor.rowcount, getattr(cursor, 'lastrowid', None)
+    
+    def _pg_prepare(self, connection: Any, cursor: Any, query: str) -> str:
+        """
+        PREPARE a statement on the PostgreSQL session unless it already exists.
+        
+        Args:
+            connection: psycopg2 connection the cursor belongs to
+            cursor: Cursor to run PREPARE on
+            query (str): SQL statement using %s placeholders
+            
+        Returns:
+            str: Name of the prepared statement
+        """
+        name = f"gdm_{hashlib.sha1(query.encode()).hexdigest()[:16]}"
+        names = _PG_PREPARED.get(connection)
+        if names is None:
+            names = _PG_PREPARED[connection] = set()
+        if name in names:
+            return name
+        
+        counter = itertools.count(1)
+        pg_query = re.sub(r'%s', lambda _: f"${next(counter)}", query)
+        # The session may already hold it if it was prepared before this process saw it
+        cursor.execute("SELECT 1 FROM pg_prepared_statements WHERE name = %s", (name,))
+        if cursor.fetchone() is None:
+            cursor.execute(f"PREPARE {name} AS {pg_query}")
+        names.add(name)
+        return name
+    
+    def _column_list(self, columns: Any) -> str:
+        """Quote and join column names with the backend's identifier quote."""
+        return ', '.join([f"{self._quote}{col}{self._quote}" for col in columns])
+    
+    def _match_clause(self, columns: Any, separator: str) -> str:
+        """Build `col = <placeholder>` terms joined by separator."""
+        return separator.join([f"{col} = {self._placeholder}" for col in columns])
+    
+    def _insert_sql(self, table: str, columns: Tuple[str, ...]) -> str:
+        """Get the cached INSERT statement for a table and column set."""
+        key = ('ins', table, columns)
+        query = self._sql_cache.get(key)
+        if query is None:
+            placeholders = ', '.join([self._placeholder] * len(columns))
+            query = f"INSERT INTO {table} ({self._column_list(columns)}) VALUES ({placeholders})"
+            self._sql_cache[key] = query
+        return query
+    
+    def _insert_values_sql(self, table: str, columns: Tuple[str, ...]) -> str:
+        """Get the cached multi-row INSERT template (psycopg2 execute_values)."""
+        key = ('ins_values', table, columns)
+        query = self._sql_cache.get(key)
+        if query is None:
+            query = f"INSERT INTO {table} ({self._column_list(columns)}) VALUES %s"
+            self._sql_cache[key] = query
+        return query
+    
+    def _get_cursor(self) -> Any:
+        """
+        Get the reusable cursor for the current connection.
+        
+        A new cursor is opened only when there is none yet, it was closed, or
+        the connector has since reconnected.
+        """
+        connection = self.connector.connection
+        cursor = self._cursor
+        if cursor is None or self._cursor_conn is not connection or getattr(cursor, 'closed', False):
+            cursor = connection.cursor()
+            self._cursor = cursor
+            self._cursor_conn = connection
+        return cursor
+    
+    def _discard_cursor(self) -> None:
+        """
+        Close and drop the reusable cursor after an error.
+        
+        Closing it releases any unread MySQL result so the next cursor on the
+        connection does not fail with "Unread result found".
+        """
+        cursor = self._cursor
+        self._cursor = None
+        if cursor is None:
+            return
+        if self.connector.config['driver'] == 'mysql.connector':
+            # mysql.connector refuses to close a cursor with pending rows
+            try:
+                cursor.fetchall()
+            except Exception:
+                pass
+        try:
+            cursor.close()
+        except Exception:
+            pass
+    
+    def _get_mongo_db(self) -> Any:
+        """Get the MongoDB database handle, cached until the connector reconnects."""
+        connection = self.connector.connection
+        if self._mongo_db is None or self._mongo_client is not connection:
+            self._mongo_db = connection[self.connector.config['connection_params']['database']]
+            self._mongo_client = connection
+        return self._mongo_db
+    
+    def _commit(self) -> None:
+        """Commit the last write unless a transaction() block is open."""
+        if not self._in_transaction:
+            self.connector.connection.commit()
+    
+    def _rollback(self) -> None:
+        """Roll back a failed relational write unless a transaction() block is open."""
+        if self._in_transaction or self.connector.config['type'] != 'relational':
+            return
+        try:
+            self.connector.connection.rollback()
+        except Exception as e:
+            logger.error("Error rolling back: %s", e)
+    
+    @contextmanager
+    def transaction(self) -> Iterator["GenericDatabaseManager"]:
+        """
+        Group relational writes into a single transaction.
+        
+        Writes inside the block are not committed individually. The
+        transaction commits once on exit, or rolls back if the block raises
+        or any operation inside it failed. Non-relational backends are unaffected.
+        
+        Yields:
+            GenericDatabaseManager: This manager
+        """
+        if self.connector.config['type'] != 'relational' or self._in_transaction:
+            yield self
+            return
+        
+        if not self.connector.is_connected():
+            # The operations inside the block report the missing connection themselves
+            logger.error("No database connection available")
+            yield self
+            return
+        
+        connection = self.connector.connection
+        autocommit = getattr(connection, 'autocommit', False)
+        if autocommit:
+            connection.autocommit = False
+        
+        self._in_transaction = True
+        self._transaction_failed = False
+        try:
+            yield self
+        except Exception:
+            connection.rollback()
+            logger.error("Transaction rolled back")
+            raise
+        else:
+            if self._transaction_failed:
+                connection.rollback()
+                logger.error("Transaction rolled back after a failed operation")
+            else:
+                connection.commit()
+                logger.info("Transaction committed")
+        finally:
+            self._in_transaction = False
+            if autocommit:
+                connection.autocommit = True
     
     # ==================== INSERT OPERATIONS ====================
     
@@ -64,61 +379,134 @@ class GenericDatabaseManager:
             logger.error("No database connection available")
             return None
         
+        handler = self._insert_dispatch.get(self.connector.config['type'])
+        if handler is None:
+            logger.error("Insert not implemented for %s", self.connector.config['type'])
+            return None
+        
         try:
-            if self.connector.config['type'] == 'relational':
-                return self._insert_one_relational(table_or_collection, data)
-            elif self.connector.config['type'] == 'nosql_document':
-                return self._insert_one_document(table_or_collection, data)
-            elif self.connector.config['type'] == 'nosql_search':
-                return self._insert_one_search(table_or_collection, data)
-            else:
-                logger.error(f"Insert not implemented for {self.connector.config['type']}")
-                return None
-                
+            return handler(table_or_collection, data)
         except Exception as e:
-            logger.error(f"Error inserting data: {e}")
+            logger.error("Error inserting data: %s", e)
+            # Clear the failed statement so the connection stays usable
+            self._rollback()
+            self.connector.invalidate_connection_check()
+            self._discard_cursor()
+            if self._in_transaction:
+                self._transaction_failed = True
             return None
     
     def _insert_one_relational(self, table: str, data: Dict[str, Any]) -> Optional[int]:
         """Insert into relational database."""
-        columns = ', '.join([f"{self.syntax.get('identifier_quote', '')}{col}{self.syntax.get('identifier_quote', '')}" 
-                            for col in data.keys()])
-        placeholders = ', '.join([self.syntax.get('placeholder', '?')] * len(data))
+        query = self._insert_sql(table, tuple(data))
         
-        query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+        _, last_id = self._execute_write(query, tuple(data.values()))
         
-        cursor = self.connector.connection.cursor()
-        cursor.execute(query, tuple(data.values()))
-        self.connector.connection.commit()
-        
-        last_id = cursor.lastrowid if hasattr(cursor, 'lastrowid') else None
-        cursor.close()
-        
-        logger.info(f"Inserted record into {table}")
+        logger.info("Inserted record into %s", table)
         return last_id
     
     def _insert_one_document(self, collection: str, data: Dict[str, Any]) -> Optional[str]:
         """Insert into document database (MongoDB)."""
-        db = self.connector.connection[self.connector.config['connection_params']['database']]
+        db = self._get_mongo_db()
         result = db[collection].insert_one(data)
-        logger.info(f"Inserted document into {collection}")
+        logger.info("Inserted document into %s", collection)
         return str(result.inserted_id)
     
     def _insert_one_search(self, index: str, data: Dict[str, Any]) -> Optional[str]:
         """Insert into search engine (Elasticsearch)."""
         result = self.connector.connection.index(index=index, document=data)
-        logger.info(f"Indexed document in {index}")
+        logger.info("Indexed document in %s", index)
         return result['_id']
     
+    def insert_many(self, table_or_collection: str, rows: List[Dict[str, Any]]) -> Optional[Any]:
+        """
+        Insert multiple records/documents in a single batch.
+        
+        Args:
+            table_or_collection (str): Table name (SQL) or collection name (NoSQL)
+            rows (List[Dict[str, Any]]): Records to insert
+            
+        Returns:
+            Number of records inserted (SQL, search) or list of inserted IDs
+            (document), None if error
+        """
+        if not self.connector.is_connected():
+            logger.error("No database connection available")
+            return None
+        
+        if not rows:
+            return 0
+        
+        handler = self._insert_many_dispatch.get(self.connector.config['type'])
+        if handler is None:
+            logger.error("Batch insert not implemented for %s", self.connector.config['type'])
+            return None
+        
+        try:
+            return handler(table_or_collection, rows)
+        except Exception as e:
+            logger.error("Error inserting data: %s", e)
+            # Discard the groups already sent so the batch is all-or-nothing
+            self._rollback()
+            self.connector.invalidate_connection_check()
+            self._discard_cursor()
+            if self._in_transaction:
+                self._transaction_failed = True
+            return None
+    
+    def _insert_many_relational(self, table: str, rows: List[Dict[str, Any]]) -> int:
+        """Batch insert into relational database with one statement per column set."""
+        # Group rows sharing the same columns so each group is a single statement
+        groups: Dict[Tuple[str, ...], List[Tuple[Any, ...]]] = {}
+        for row in rows:
+            cols = tuple(row.keys())
+            groups.setdefault(cols, []).append(tuple(row[c] for c in cols))
+        
+        cursor = self._get_cursor()
+        for cols, values in groups.items():
+            if self.connector.config['driver'] == 'psycopg2':
+                # Multi-row VALUES list instead of one statement per row
+                from psycopg2.extras import execute_values
+                execute_values(cursor, self._insert_values_sql(table, cols), 
+                               values, page_size=1000)
+            else:
+                cursor.executemany(self._insert_sql(table, cols), values)
+        
+        self._commit()
+        
+        logger.info("Inserted %s records into %s", len(rows), table)
+        return len(rows)
+    
+    def _insert_many_document(self, collection: str, docs: List[Dict[str, Any]]) -> List[str]:
+        """Batch insert into document database (MongoDB)."""
+        db = self._get_mongo_db()
+        # Unordered lets the server keep going past individual document errors
+        result = db[collection].insert_many(docs, ordered=False)
+        logger.info("Inserted %s documents into %s", len(result.inserted_ids), collection)
+        return [str(inserted_id) for inserted_id in result.inserted_ids]
+    
+    def _insert_many_search(self, index: str, docs: List[Dict[str, Any]]) -> int:
+        """Batch index into search engine (Elasticsearch) via the bulk API."""
+        from elasticsearch.helpers import bulk
+        
+        success, _ = bulk(
+            self.connector.connection,
+            ({"_index": index, "_source": doc} for doc in docs)
+        )
+        logger.info("Indexed %s documents in %s", success, index)
+        return success
+    
     # ==================== SELECT/QUERY OPERATIONS ====================
     
-    def find_all(self, table_or_collection: str, limit: int = 100) -> Optional[List[Dict[str, Any]]]:
+    def find_all(self, table_or_collection: str, limit: int = 100,
+                 fields: Optional[List[str]] = None) -> Optional[List[Dict[str, Any]]]:
         """
         Retrieve all records/documents with optional limit.
         
         Args:
             table_or_collection (str): Table/collection name
             limit (int): Maximum number of records to return
+            fields (List[str], optional): Fields to return (all fields if None)
             
         Returns:
             List of records/documents, None if error
@@ -127,65 +515,294 @@ class GenericDatabaseManager:
             logger.error("No database connection available")
             return None
         
+        handler = self._find_dispatch.get(self.connector.config['type'])
+        if handler is None:
+            logger.error("Find not implemented for %s", self.connector.config['type'])
+            return None
+        
         try:
-            if self.connector.config['type'] == 'relational':
-                return self._find_all_relational(table_or_collection, limit)
-            elif self.connector.config['type'] == 'nosql_document':
-                return self._find_all_document(table_or_collection, limit)
-            elif self.connector.config['type'] == 'nosql_search':
-                return self._find_all_search(table_or_collection, limit)
-            else:
-                logger.error(f"Find not implemented for {self.connector.config['type']}")
-                return None
-                
+            return handler(table_or_collection, limit, fields)
         except Exception as e:
-            logger.error(f"Error retrieving data: {e}")
+            logger.error("Error retrieving data: %s", e)
+            self.connector.invalidate_connection_check()
+            self._discard_cursor()
+            if self._in_transaction:
+                self._transaction_failed = True
             return None
     
-    def _find_all_relational(self, table: str, limit: int) -> List[Dict[str, Any]]:
+    def _select_query(self, table: str, limit: int, fields: Optional[List[str]]) -> str:
+        """Get the cached SELECT for the requested fields with the backend's limit clause."""
+        key = ('select', table, limit, tuple(fields) if fields else None)
+        query = self._sql_cache.get(key)
+        if query is None:
+            if fields:
+                columns = self._column_list(fields)
+            else:
+                columns = '*'
+            if self._limit_fast:
+                limit_clause = f"LIMIT {limit}"
+            else:
+                limit_clause = self._limit_tpl.format(limit=limit, offset=0)
+            query = f"SELECT {columns} FROM {table} {limit_clause}"
+            self._sql_cache[key] = query
+        return query
+    
+    def _find_all_relational(self, table: str, limit: int, 
+                             fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """Find all in relational database."""
-        limit_clause = self.syntax.get('limit_clause', 'LIMIT {limit}').format(limit=limit, offset=0)
-        query = f"SELECT * FROM {table} {limit_clause}"
+        query = self._select_query(table, limit, fields)
         
-        cursor = self.connector.connection.cursor()
+        cursor = self._get_cursor()
         cursor.execute(query)
         
         # Get column names
         columns = [desc[0] for desc in cursor.description]
         
-        # Fetch results
-        rows = cursor.fetchall()
-        cursor.close()
-        
-        # Convert to list of dicts
-        results = [dict(zip(columns, row)) for row in rows]
-        logger.info(f"Retrieved {len(results)} records from {table}")
+        # Convert to dicts chunk by chunk; with MySQL's unbuffered cursor the raw
+        # rows are read off the socket as they are converted. psycopg2's
+        # client-side cursor already holds the whole result, so use iter_all()
+        # for a server-side cursor on large PostgreSQL tables.
+        results = [dict(zip(columns, row)) for row in _iter_rows(cursor)]
+        logger.info("Retrieved %s records from %s", len(results), table)
         return results
     
-    def _find_all_document(self, collection: str, limit: int) -> List[Dict[str, Any]]:
+    def _find_all_document(self, collection: str, limit: int, 
+                           fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """Find all in document database."""
-        db = self.connector.connection[self.connector.config['connection_params']['database']]
-        results = list(db[collection].find().limit(limit))
+        db = self._get_mongo_db()
+        projection = {field: 1 for field in fields} if fields else None
+        results = list(db[collection].find(projection=projection).limit(limit))
         
         # Convert ObjectId to string
         for doc in results:
             if '_id' in doc:
                 doc['_id'] = str(doc['_id'])
         
-        logger.info(f"Retrieved {len(results)} documents from {collection}")
+        logger.info("Retrieved %s documents from %s", len(results), collection)
         return results
     
-    def _find_all_search(self, index: str, limit: int) -> List[Dict[str, Any]]:
+    def _find_all_search(self, index: str, limit: int, 
+                         fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """Find all in search engine."""
-        result = self.connector.connection.search(
-            index=index,
-            body={"query": {"match_all": {}}, "size": limit}
-        )
+        body = {"query": {"match_all": {}}, "size": limit}
+        if fields:
+            body["_source"] = fields
+        result = self.connector.connection.search(index=index, body=body)
         
         documents = [hit['_source'] for hit in result['hits']['hits']]
-        logger.info(f"Retrieved {len(documents)} documents from {index}")
+        logger.info("Retrieved %s documents from %s", len(documents), index)
         return documents
     
+    def find_all_rows(self, table: str, limit: int = 100,
+                      fields: Optional[List[str]] = None) -> Optional[Tuple[List[str], List[Tuple[Any, ...]]]]:
+        """
+        Retrieve records from a relational table as raw row tuples.
+        
+        Skips building a dict per row; use this when the caller only needs
+        positional access or handles large results.
+        
+        Args:
+            table (str): Table name
+            limit (int): Maximum number of records to return
+            fields (List[str], optional): Columns to return (all columns if None)
+            
+        Returns:
+            Tuple of (column names, row tuples), None if error
+        """
+        if not self.connector.is_connected():
+            logger.error("No database connection available")
+            return None
+        
+        if self.connector.config['type'] != 'relational':
+            logger.error("Row retrieval not implemented for %s", self.connector.config['type'])
+            return None
+        
+        try:
+            columns, rows = self._fetch_rows(table, limit, fields)
+            logger.info("Retrieved %s records from %s", len(rows), table)
+            return columns, rows
+        except Exception as e:
+            logger.error("Error retrieving data: %s", e)
+            self.connector.invalidate_connection_check()
+            self._discard_cursor()
+            if self._in_transaction:
+                self._transaction_failed = True
+            return None
+    
+    def _fetch_rows(self, table: str, limit: int, 
+                    fields: Optional[List[str]]) -> Tuple[List[str], List[Tuple[Any, ...]]]:
+        """Run a SELECT and return column names with the fetched row tuples."""
+        query = self._select_query(table, limit, fields)
+        
+        cursor = self._get_cursor()
+        cursor.execute(query)
+        
+        # Get column names
+        columns = [desc[0] for desc in cursor.description]
+        
+        # Fetch results
+        rows = cursor.fetchall()
+        return columns, rows
+    
+    def iter_all(self, table_or_collection: str, limit: int = 100,
+                 batch_size: int = 100, 
+                 fields: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream records/documents without materializing the whole result.
+        
+        Rows are fetched from the server in batches, so memory stays bounded
+        by batch_size and the first row is available before the query ends.
+        
+        Args:
+            table_or_collection (str): Table/collection name
+            limit (int): Maximum number of records to return
+            batch_size (int): Number of records fetched per round-trip
+            fields (List[str], optional): Fields to return (all fields if None)
+            
+        Returns:
+            Iterator of records/documents, empty if error
+        """
+        if not self.connector.is_connected():
+            logger.error("No database connection available")
+            return iter(())
+        
+        handler = self._iter_dispatch.get(self.connector.config['type'])
+        if handler is None:
+            logger.error("Streaming not implemented for %s", self.connector.config['type'])
+            return iter(())
+        
+        return self._guard_iter(handler(table_or_collection, limit, batch_size, fields))
+    
+    def _guard_iter(self, rows: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Log and stop on errors raised while streaming."""
+        try:
+            yield from rows
+        except Exception as e:
+            logger.error("Error retrieving data: %s", e)
+            self.connector.invalidate_connection_check()
+            self._discard_cursor()
+            if self._in_transaction:
+                self._transaction_failed = True
+    
+    def _iter_all_relational(self, table: str, limit: int, batch_size: int,
+                             fields: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """Stream from relational database."""
+        query = self._select_query(table, limit, fields)
+        
+        connection = self.connector.connection
+        driver_name = self.connector.config['driver']
+        
+        if driver_name == 'psycopg2':
+            # Named cursors are server-side: rows stay on the server until fetched
+            cursor = connection.cursor(name=f"stream_{next(self._stream_ids)}")
+            cursor.itersize = batch_size
+        elif driver_name == 'mysql.connector':
+            cursor = connection.cursor(buffered=False)
+        else:
+            cursor = connection.cursor()
+        
+        count = 0
+        executed = False
+        exhausted = False
+        try:
+            cursor.execute(query)
+            executed = True
+            columns = None
+            for row in _iter_rows(cursor, batch_size):
+                if columns is None:
+                    # Named cursors only expose a description after the first fetch
+                    columns = [desc[0] for desc in cursor.description]
+                count += 1
+                yield dict(zip(columns, row))
+            exhausted = True
+        finally:
+            if driver_name == 'mysql.connector' and executed and not exhausted:
+                # Unbuffered results must be drained before the connection is reused
+                cursor.fetchall()
+            cursor.close()
+        
+        logger.info("Streamed %s records from %s", count, table)
+    
+    def _iter_all_document(self, collection: str, limit: int, batch_size: int,
+                           fields: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """Stream from document database."""
+        db = self._get_mongo_db()
+        projection = {field: 1 for field in fields} if fields else None
+        
+        count = 0
+        for doc in db[collection].find(projection=projection).limit(limit).batch_size(batch_size):
+            if '_id' in doc:
+                doc['_id'] = str(doc['_id'])
+            count += 1
+            yield doc
+        
+        logger.info("Streamed %s documents from %s", count, collection)
+    
+    # ==================== COUNT OPERATIONS ====================
+    
+    def count(self, table_or_collection: str, 
+              conditions: Optional[Dict[str, Any]] = None) -> Optional[int]:
+        """
+        Count records/documents on the server without fetching them.
+        
+        Args:
+            table_or_collection (str): Table/collection name
+            conditions (Dict, optional): WHERE/filter conditions
+            
+        Returns:
+            Number of matching records, None if error
+        """
+        if not self.connector.is_connected():
+            logger.error("No database connection available")
+            return None
+        
+        handler = self._count_dispatch.get(self.connector.config['type'])
+        if handler is None:
+            logger.error("Count not implemented for %s", self.connector.config['type'])
+            return None
+        
+        try:
+            return handler(table_or_collection, conditions or {})
+        except Exception as e:
+            logger.error("Error counting data: %s", e)
+            self.connector.invalidate_connection_check()
+            self._discard_cursor()
+            if self._in_transaction:
+                self._transaction_failed = True
+            return None
+    
+    def _count_relational(self, table: str, conditions: Dict[str, Any]) -> int:
+        """Count in relational database."""
+        key = ('count', table, tuple(conditions))
+        query = self._sql_cache.get(key)
+        if query is None:
+            query = f"SELECT COUNT(*) FROM {table}"
+            if conditions:
+                query = f"{query} WHERE {self._match_clause(conditions, ' AND ')}"
+            self._sql_cache[key] = query
+        
+        cursor = self._get_cursor()
+        cursor.execute(query, tuple(conditions.values()))
+        # fetchall() so unbuffered drivers have no pending result on the shared cursor
+        total = cursor.fetchall()[0][0]
+        
+        logger.info("Counted %s records in %s", total, table)
+        return total
+    
+    def _count_document(self, collection: str, conditions: Dict[str, Any]) -> int:
+        """Count in document database."""
+        db = self._get_mongo_db()
+        total = db[collection].count_documents(conditions)
+        logger.info("Counted %s documents in %s", total, collection)
+        return total
+    
+    def _count_search(self, index: str, conditions: Dict[str, Any]) -> int:
+        """Count in search engine."""
+        query = {"match": conditions} if conditions else {"match_all": {}}
+        result = self.connector.connection.count(index=index, body={"query": query})
+        logger.info("Counted %s documents in %s", result['count'], index)
+        return result['count']
+    
     # ==================== UPDATE OPERATIONS ====================
     
     def update_one(self, table_or_collection: str, 
@@ -206,65 +823,71 @@ class GenericDatabaseManager:
             logger.error("No database connection available")
             return None
         
+        handler = self._update_dispatch.get(self.connector.config['type'])
+        if handler is None:
+            logger.error("Update not implemented for %s", self.connector.config['type'])
+            return None
+        
         try:
-            if self.connector.config['type'] == 'relational':
-                return self._update_one_relational(table_or_collection, conditions, data)
-            elif self.connector.config['type'] == 'nosql_document':
-                return self._update_one_document(table_or_collection, conditions, data)
-            elif self.connector.config['type'] == 'nosql_search':
-                return self._update_one_search(table_or_collection, conditions, data)
-            else:
-                logger.error(f"Update not implemented for {self.connector.config['type']}")
-                return None
-                
+            return handler(table_or_collection, conditions, data)
         except Exception as e:
-            logger.error(f"Error updating data: {e}")
+            logger.error("Error updating data: %s", e)
+            # Clear the failed statement so the connection stays usable
+            self._rollback()
+            self.connector.invalidate_connection_check()
+            self._discard_cursor()
+            if self._in_transaction:
+                self._transaction_failed = True
             return None
     
     def _update_one_relational(self, table: str, conditions: Dict[str, Any], 
                               data: Dict[str, Any]) -> int:
         """Update in relational database."""
-        set_clause = ', '.join([f"{col} = {self.syntax.get('placeholder', '?')}" 
-                               for col in data.keys()])
-        where_clause = ' AND '.join([f"{col} = {self.syntax.get('placeholder', '?')}" 
-                                    for col in conditions.keys()])
+        key = ('upd', table, tuple(data), tuple(conditions))
+        query = self._sql_cache.get(key)
+        if query is None:
+            set_clause = self._match_clause(data, ', ')
+            where_clause = self._match_clause(conditions, ' AND ')
+            query = f"UPDATE {table} SET {set_clause} WHERE {where_clause}"
+            self._sql_cache[key] = query
         
-        query = f"UPDATE {table} SET {set_clause} WHERE {where_clause}"
         params = tuple(list(data.values()) + list(conditions.values()))
         
-        cursor = self.connector.connection.cursor()
-        cursor.execute(query, params)
-        self.connector.connection.commit()
+        row_count, _ = self._execute_write(query, params)
         
-        row_count = cursor.rowcount
-        cursor.close()
-        
-        logger.info(f"Updated {row_count} record(s) in {table}")
+        logger.info("Updated %s record(s) in %s", row_count, table)
         return row_count
     
     def _update_one_document(self, collection: str, conditions: Dict[str, Any], 
                             data: Dict[str, Any]) -> int:
         """Update in document database."""
-        db = self.connector.connection[self.connector.config['connection_params']['database']]
+        db = self._get_mongo_db()
         result = db[collection].update_one(conditions, {"$set": data})
-        logger.info(f"Updated {result.modified_count} document(s) in {collection}")
+        logger.info("Updated %s document(s) in %s", result.modified_count, collection)
         return result.modified_count
     
     def _update_one_search(self, index: str, conditions: Dict[str, Any], 
                           data: Dict[str, Any]) -> int:
         """Update in search engine."""
+        # Stable script text per key set so Elasticsearch's script cache hits
+        keys = tuple(sorted(data))
+        source = self._es_script_cache.get(keys)
+        if source is None:
+            source = '; '.join([f"ctx._source.{k} = params.{k}" for k in keys])
+            self._es_script_cache[keys] = source
+        
         # Elasticsearch update by query
         result = self.connector.connection.update_by_query(
             index=index,
             body={
                 "query": {"match": conditions},
                 "script": {
-                    "source": " ".join([f"ctx._source.{k} = params.{k}" for k in data.keys()]),
+                    "source": source,
                     "params": data
                 }
             }
         )
-        logger.info(f"Updated {result['updated']} document(s) in {index}")
+        logger.info("Updated %s document(s) in %s", result['updated'], index)
         return result['updated']
     
     # ==================== DELETE OPERATIONS ====================
@@ -285,43 +908,41 @@ class GenericDatabaseManager:
             logger.error("No database connection available")
             return None
         
+        handler = self._delete_dispatch.get(self.connector.config['type'])
+        if handler is None:
+            logger.error("Delete not implemented for %s", self.connector.config['type'])
+            return None
+        
         try:
-            if self.connector.config['type'] == 'relational':
-                return self._delete_one_relational(table_or_collection, conditions)
-            elif self.connector.config['type'] == 'nosql_document':
-                return self._delete_one_document(table_or_collection, conditions)
-            elif self.connector.config['type'] == 'nosql_search':
-                return self._delete_one_search(table_or_collection, conditions)
-            else:
-                logger.error(f"Delete not implemented for {self.connector.config['type']}")
-                return None
-                
+            return handler(table_or_collection, conditions)
         except Exception as e:
-            logger.error(f"Error deleting data: {e}")
+            logger.error("Error deleting data: %s", e)
+            # Clear the failed statement so the connection stays usable
+            self._rollback()
+            self.connector.invalidate_connection_check()
+            self._discard_cursor()
+            if self._in_transaction:
+                self._transaction_failed = True
             return None
     
     def _delete_one_relational(self, table: str, conditions: Dict[str, Any]) -> int:
         """Delete from relational database."""
-        where_clause = ' AND '.join([f"{col} = {self.syntax.get('placeholder', '?')}" 
-                                    for col in conditions.keys()])
+        key = ('del', table, tuple(conditions))
+        query = self._sql_cache.get(key)
+        if query is None:
+            query = f"DELETE FROM {table} WHERE {self._match_clause(conditions, ' AND ')}"
+            self._sql_cache[key] = query
         
-        query = f"DELETE FROM {table} WHERE {where_clause}"
-        
-        cursor = self.connector.connection.cursor()
-        cursor.execute(query, tuple(conditions.values()))
-        self.connector.connection.commit()
+        row_count, _ = self._execute_write(query, tuple(conditions.values()))
         
-        row_count = cursor.rowcount
-        cursor.close()
-        
-        logger.info(f"Deleted {row_count} record(s) from {table}")
+        logger.info("Deleted %s record(s) from %s", row_count, table)
         return row_count
     
     def _delete_one_document(self, collection: str, conditions: Dict[str, Any]) -> int:
         """Delete from document database."""
-        db = self.connector.connection[self.connector.config['connection_params']['database']]
+        db = self._get_mongo_db()
         result = db[collection].delete_one(conditions)
-        logger.info(f"Deleted {result.deleted_count} document(s) from {collection}")
+        logger.info("Deleted %s document(s) from %s", result.deleted_count, collection)
         return result.deleted_count
     
     def _delete_one_search(self, index: str, conditions: Dict[str, Any]) -> int:
@@ -330,9 +951,88 @@ class GenericDatabaseManager:
             index=index,
             body={"query": {"match": conditions}}
         )
-        logger.info(f"Deleted {result['deleted']} document(s) from {index}")
+        logger.info("Deleted %s document(s) from %s", result['deleted'], index)
         return result['deleted']
 
+    
+    # ==================== KEY-VALUE OPERATIONS ====================
+    
+    def pop_tasks(self, queue: str, count: int = 1) -> Optional[List[Any]]:
+        """
+        Pop up to `count` items from the head of a list in one round-trip.
+        
+        Uses LMPOP on Redis 7+ and falls back to a pipeline of LPOPs on
+        older servers.
+        
+        Args:
+            queue (str): List key
+            count (int): Maximum number of items to pop (at least 1)
+            
+        Returns:
+            List of popped items (empty if the list is empty), None if error
+        """
+        if count < 1:
+            logger.error("Pop count must be at least 1, got %s", count)
+            return None
+        
+        if not self.connector.is_connected():
+            logger.error("No database connection available")
+            return None
+        
+        if self.connector.config['type'] != 'nosql_key_value':
+            logger.error("Pop not implemented for %s", self.connector.config['type'])
+            return None
+        
+        try:
+            redis_conn = self.connector.connection
+            
+            if self._get_server_version() >= (7, 0):
+                result = redis_conn.lmpop(1, queue, direction="LEFT", count=count)
+                items = result[1] if result else []
+            else:
+                with redis_conn.pipeline(transaction=False) as pipe:
+                    for _ in range(count):
+                        pipe.lpop(queue)
+                    items = [item for item in pipe.execute() if item is not None]
+            
+            logger.info("Popped %s item(s) from %s", len(items), queue)
+            return items
+        except Exception as e:
+            logger.error("Error popping data: %s", e)
+            self.connector.invalidate_connection_check()
+            return None
+    
+    def get_set(self, key: str, batch_size: int = 500) -> Iterator[Any]:
+        """
+        Iterate over the members of a set in batches.
+        
+        Uses SSCAN rather than SMEMBERS, so large sets are streamed in chunks
+        instead of being returned (and blocking the server) in one reply.
+        
+        Args:
+            key (str): Set key
+            batch_size (int): Members requested per round-trip (SSCAN COUNT hint)
+            
+        Returns:
+            Iterator of set members, empty if error
+        """
+        if not self.connector.is_connected():
+            logger.error("No database connection available")
+            return iter(())
+        
+        if self.connector.config['type'] != 'nosql_key_value':
+            logger.error("Set scan not implemented for %s", self.connector.config['type'])
+            return iter(())
+        
+        return self._guard_iter(self.connector.connection.sscan_iter(key, count=batch_size))
+    
+    def _get_server_version(self) -> Tuple[int, ...]:
+        """Get the key-value server version (queried once and cached)."""
+        if self._server_version is None:
+            version = self.connector.connection.info('server')['redis_version']
+            self._server_version = tuple(int(part) for part in version.split('.')[:2])
+        return self._server_version
+
 
 def main():
     """Example usage of GenericDatabaseManager."""
@@ -345,15 +1045,15 @@ def main():
             # Insert
             user_data = {"name": "John Doe", "age": 30, "email": "john@example.com"}
             user_id = manager.insert_one("users", user_data)
-            logger.info(f"Inserted user with ID: {user_id}")
+            logger.info("Inserted user with ID: %s", user_id)
             
             # Find all
             users = manager.find_all("users", limit=10)
-            logger.info(f"Found {len(users) if users else 0} users")
+            logger.info("Found %s users", len(users) if users else 0)
             
             # Update
             updated = manager.update_one("users", {"name": "John Doe"}, {"age": 31})
-            logger.info(f"Updated {updated} user(s)")
+            logger.info("Updated %s user(s)", updated)
     
     # Example with MongoDB
     print("\n=== Testing MongoDB Operations ===")
@@ -364,11 +1064,11 @@ def main():
             # Insert
             doc_data = {"name": "Jane Smith", "age": 25, "city": "New York"}
             doc_id = manager.insert_one("users", doc_data)
-            logger.info(f"Inserted document with ID: {doc_id}")
+            logger.info("Inserted document with ID: %s", doc_id)
             
             # Find all
             docs = manager.find_all("users", limit=10)
-            logger.info(f"Found {len(docs) if docs else 0} documents")
+            logger.info("Found %s documents", len(docs) if docs else 0)
 
 
 if __name__ == "__main__":